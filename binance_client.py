@@ -1,58 +1,94 @@
 import hmac
-import hashlib
 import time
 import requests
 import logging
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlencode
 from config import Config
 
+try:
+    # Optional faster JSON parser; its decode error subclasses ValueError like json's
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_SIDES = frozenset(('BUY', 'SELL'))
+_ORDER_TYPES = frozenset(('MARKET', 'LIMIT'))
+
 class BinanceFuturesClient:
     """Client for interacting with Binance Futures Testnet API"""
     
+    # Connection pool shared by every client instance so keep-alive
+    # connections survive across OrderCLI() instantiations
+    _adapter: Optional[HTTPAdapter] = None
+    
+    # How long a successful ping is trusted before test_connection re-checks
+    PING_CACHE_SECONDS = 30
+    
+    @classmethod
+    def _get_adapter(cls) -> HTTPAdapter:
+        """Return the process-wide pooled HTTP adapter, creating it on first use"""
+        if cls._adapter is None:
+            cls._adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                # Retry is limited to idempotent methods by default, so orders are never resent
+                max_retries=Retry(total=3, backoff_factor=0.2,
+                                  status_forcelist=[429, 500, 502, 503, 504])
+            )
+        return cls._adapter
+    
     def __init__(self, api_key: str, secret_key: str):
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_key_bytes = secret_key.encode('utf-8')
         self.base_url = Config.BASE_URL
+        self._last_ping_ok_ts = 0.0
         self.session = requests.Session()
+        self.session.mount('https://', self._get_adapter())
         self.session.headers.update({
             'X-MBX-APIKEY': self.api_key,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/x-www-form-urlencoded'
         })
     
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
-        """Generate HMAC SHA256 signature for request"""
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+    def _generate_signature(self, query_string: bytes) -> str:
+        """Generate HMAC SHA256 signature for an encoded query string"""
+        # One-shot C path into OpenSSL; no Python-level HMAC object per call
+        return hmac.digest(self._secret_key_bytes, query_string, 'sha256').hex()
     
-    def _send_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, 
+    def _send_request(self, method: str, endpoint: str, params: Optional[List[Tuple[str, Any]]] = None, 
                       signed: bool = False) -> Dict[str, Any]:
-        """Send HTTP request to Binance API"""
+        """
+        Send HTTP request to Binance API
+        
+        params is an ordered list of (key, value) pairs. They are urlencoded
+        once; the same bytes are signed and sent, as the query string for GET
+        and as the form body for POST.
+        """
         url = f"{self.base_url}{endpoint}"
         
-        if params is None:
-            params = {}
+        params = list(params) if params else []
         
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            params['signature'] = self._generate_signature(params)
+            params.append(('timestamp', str(time.time_ns() // 1_000_000)))
+        
+        query = urlencode(params).encode('ascii')
+        if signed:
+            query += b'&signature=' + self._generate_signature(query).encode('ascii')
         
         try:
-            logger.info(f"Sending {method} request to {endpoint} with params: {params}")
+            logger.info("Sending %s request to %s with params: %s", method, endpoint, params)
             
             if method == 'GET':
-                # response = self.session.get(url, params=params, timeout=10)
-                response = self.session.get(url, data=params, timeout=10)
+                response = self.session.get(url, params=query, timeout=10)
             elif method == 'POST':
-                # response = self.session.post(url, params=params, timeout=10)
-                response = self.session.post(url, data=params, timeout=10)
+                response = self.session.post(url, data=query, timeout=10)
                 # Add after getting response:
                 if response.history:  # Check for redirects
                     raise Exception(f"Request redirected! Wrong URL or endpoint. Final URL: {response.url}")
@@ -60,16 +96,16 @@ class BinanceFuturesClient:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
-            logger.info(f"Response received: {data}")
+            logger.info("Response received: %s", data)
             return data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error: {e}")
+            logger.error("Network error: %s", e)
             raise Exception(f"Network error: {str(e)}")
         except ValueError as e:
-            logger.error(f"JSON parsing error: {e}")
+            logger.error("JSON parsing error: %s", e)
             raise Exception(f"Invalid response from server: {str(e)}")
     
     def place_order(self, symbol: str, side: str, order_type: str, 
@@ -78,9 +114,9 @@ class BinanceFuturesClient:
         Place a new order on Binance Futures
         
         Args:
-            symbol: Trading pair (e.g., BTCUSDT)
-            side: BUY or SELL
-            order_type: MARKET or LIMIT
+            symbol: Trading pair, already upper-cased (e.g., BTCUSDT)
+            side: BUY or SELL, upper-case
+            order_type: MARKET or LIMIT, upper-case
             quantity: Order quantity
             price: Required for LIMIT orders
         
@@ -88,10 +124,10 @@ class BinanceFuturesClient:
             Order response from Binance API
         """
         # Validate inputs
-        if side not in ['BUY', 'SELL']:
+        if side not in _SIDES:
             raise ValueError("Side must be either 'BUY' or 'SELL'")
         
-        if order_type not in ['MARKET', 'LIMIT']:
+        if order_type not in _ORDER_TYPES:
             raise ValueError("Order type must be either 'MARKET' or 'LIMIT'")
         
         if order_type == 'LIMIT' and price is None:
@@ -101,28 +137,26 @@ class BinanceFuturesClient:
             raise ValueError("Quantity must be greater than 0")
         
         # Prepare order parameters
-        params = {
-            'symbol': symbol.upper(),
-            'side': side,
-            'type': order_type,
-            'quantity': round(quantity, 8),  # Binance precision
-            'newOrderRespType': 'ACK'  # Get full response
-        }
+        params = [
+            ('symbol', symbol),
+            ('side', side),
+            ('type', order_type),
+            ('quantity', f'{quantity:.8f}'),  # Binance precision
+            ('newOrderRespType', 'ACK')  # Get full response
+        ]
         
         if order_type == 'LIMIT':
-            params['timeInForce'] = 'GTC'  # Good Till Cancel
-            params['price'] = round(price, 2)  # Adjust precision as needed
+            params.append(('timeInForce', 'GTC'))  # Good Till Cancel
+            params.append(('price', f'{price:.2f}'))  # Adjust precision as needed
         
-        logger.info(f"Placing order: {params}")
+        logger.info("Placing order: %s", params)
         
         try:
             # response = self._send_request('POST', '/fapi/v1/order', params, signed=True)
-            print(params)
-            print("these are the parameters")
             response = self._send_request('POST', '/api/v3/order', params, signed=True)
             return response
         except Exception as e:
-            logger.error(f"Failed to place order: {e}")
+            logger.error("Failed to place order: %s", e)
             raise
     
     def get_account_info(self) -> Dict[str, Any]:
@@ -131,10 +165,18 @@ class BinanceFuturesClient:
         return self._send_request('GET', '/api/v3/account', signed=True)
     
     def test_connection(self) -> bool:
-        """Test API connection"""
-        try:
-            # response = self._send_request('POST', '/api/v3/order', params, signed=True)
-            response = self._send_request('GET', '/api/v3/ping')
+        """Test API connection, reusing a recent successful result"""
+        if self._last_ping_ok_ts and time.monotonic() - self._last_ping_ok_ts < self.PING_CACHE_SECONDS:
             return True
-        except:
-            return False
\ No newline at end of file
+        try:
+            response = self.session.get(f"{self.base_url}/api/v3/ping", timeout=5)
+        except requests.exceptions.RequestException as e:
+            logger.error("Connection test failed: %s", e)
+            return False
+        
+        if response.status_code != 200:
+            logger.error("Connection test failed with HTTP %s", response.status_code)
+            return False
+        
+        self._last_ping_ok_ts = time.monotonic()
+        return True
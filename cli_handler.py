@@ -1,31 +1,77 @@
 import argparse
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
-from decimal import Decimal, InvalidOperation
 from binance_client import BinanceFuturesClient
 from config import Config
 from datetime import datetime
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for more details
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'binance_debug_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+_SIDES = frozenset(('BUY', 'SELL'))
+_ORDER_TYPES = frozenset(('MARKET', 'LIMIT'))
+
+def setup_logging():
+    """Configure root logging once; later calls are no-ops"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    # Handlers run on a background listener thread so request-path logging
+    # only enqueues records instead of blocking on file/console I/O
+    log_file = f'binance_debug_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.setLevel(logging.DEBUG)  # DEBUG for more details
+    root.addHandler(QueueHandler(log_queue))
+
 class OrderCLI:
     """Command Line Interface for placing orders"""
     
+    # (response key, default) pairs in the order _RESPONSE_FMT displays them
+    _RESPONSE_FIELDS = (
+        ('orderId', 'N/A'),
+        ('symbol', 'N/A'),
+        ('side', 'N/A'),
+        ('type', 'N/A'),
+        ('status', 'N/A'),
+        ('origQty', 'N/A'),
+        ('executedQty', '0'),
+        ('price', 'N/A'),
+    )
+    _RESPONSE_FMT = "\n".join([
+        "=" * 50,
+        "✅ ORDER PLACED SUCCESSFULLY",
+        "=" * 50,
+        "Order ID: {}",
+        "Symbol: {}",
+        "Side: {}",
+        "Type: {}",
+        "Status: {}",
+        "Quantity: {}",
+        "Executed Quantity: {}",
+        "Price: {}",
+    ])
+    _RESPONSE_FOOTER_FMT = "\nTime: {}\n" + "=" * 50
+    
     def __init__(self):
         try:
             Config.validate_config()
             self.client = BinanceFuturesClient(Config.API_KEY, Config.SECRET_KEY)
         except Exception as e:
-            logger.error(f"Failed to initialize client: {e}")
+            logger.error("Failed to initialize client: %s", e)
             print(f"❌ Initialization error: {e}")
             print("Please check your API credentials in .env file")
             sys.exit(1)
@@ -34,77 +80,58 @@ class OrderCLI:
                        quantity: str, price: str = None) -> tuple:
         """Validate and parse all input parameters"""
         errors = []
+        side_u = side.upper()
+        order_type_u = order_type.upper()
         
         # Validate symbol
         if not symbol or len(symbol) < 6:
             errors.append("Symbol must be at least 6 characters (e.g., BTCUSDT)")
         
         # Validate side
-        if side.upper() not in ['BUY', 'SELL']:
+        if side_u not in _SIDES:
             errors.append("Side must be either 'BUY' or 'SELL'")
         
         # Validate order type
-        if order_type.upper() not in ['MARKET', 'LIMIT']:
+        if order_type_u not in _ORDER_TYPES:
             errors.append("Order type must be either 'MARKET' or 'LIMIT'")
         
         # Validate quantity
         try:
-            qty = Decimal(quantity)
-            if qty <= 0:
+            qty = float(quantity)
+            if not qty > 0:
                 errors.append("Quantity must be greater than 0")
-        except (InvalidOperation, ValueError):
+        except (TypeError, ValueError):
             errors.append("Quantity must be a valid number")
         
         # Validate price for LIMIT orders
         price_val = None
-        if order_type.upper() == 'LIMIT':
+        if order_type_u == 'LIMIT':
             if not price:
                 errors.append("Price is required for LIMIT orders")
             else:
                 try:
-                    price_val = Decimal(price)
-                    if price_val <= 0:
+                    price_val = float(price)
+                    if not price_val > 0:
                         errors.append("Price must be greater than 0")
-                except (InvalidOperation, ValueError):
+                except (TypeError, ValueError):
                     errors.append("Price must be a valid number")
         
         if errors:
             raise ValueError("\n".join(errors))
         
-        return (
-            symbol.upper(),
-            side.upper(),
-            order_type.upper(),
-            float(qty),
-            float(price_val) if price_val else None
-        )
+        return symbol.upper(), side_u, order_type_u, qty, price_val
     
     def format_order_response(self, response: Dict[str, Any]) -> str:
         """Format order response for display"""
         if 'code' in response and response['code'] != 200:
             return f"❌ Error: {response.get('msg', 'Unknown error')}"
         
-        output_lines = [
-            "=" * 50,
-            "✅ ORDER PLACED SUCCESSFULLY",
-            "=" * 50,
-            f"Order ID: {response.get('orderId', 'N/A')}",
-            f"Symbol: {response.get('symbol', 'N/A')}",
-            f"Side: {response.get('side', 'N/A')}",
-            f"Type: {response.get('type', 'N/A')}",
-            f"Status: {response.get('status', 'N/A')}",
-            f"Quantity: {response.get('origQty', 'N/A')}",
-            f"Executed Quantity: {response.get('executedQty', '0')}",
-            f"Price: {response.get('price', 'N/A')}",
-        ]
+        text = self._RESPONSE_FMT.format(*[response.get(k, d) for k, d in self._RESPONSE_FIELDS])
         
         if 'avgPrice' in response and float(response['avgPrice']) > 0:
-            output_lines.append(f"Average Price: {response['avgPrice']}")
-        
-        output_lines.append(f"Time: {response.get('updateTime', 'N/A')}")
-        output_lines.append("=" * 50)
+            text += f"\nAverage Price: {response['avgPrice']}"
         
-        return "\n".join(output_lines)
+        return text + self._RESPONSE_FOOTER_FMT.format(response.get('updateTime', 'N/A'))
     
     def place_order_interactive(self):
         """Interactive order placement"""
@@ -171,13 +198,13 @@ class OrderCLI:
             print("\n\nOrder cancelled by user.")
         except Exception as e:
             print(f"\n❌ Error: {e}")
-            logger.error(f"Order placement failed: {e}")
+            logger.error("Order placement failed: %s", e)
     
     def run_from_args(self, args):
         """Run from command line arguments"""
         try:
-            # Test connection
-            if not self.client.test_connection():
+            # Test connection (connectivity errors still surface from the order request)
+            if not args.skip_ping and not self.client.test_connection():
                 print("❌ Cannot connect to Binance API")
                 sys.exit(1)
             
@@ -213,12 +240,11 @@ class OrderCLI:
             
         except Exception as e:
             print(f"❌ Error: {e}")
-            logger.error(f"Order placement failed: {e}")
+            logger.error("Order placement failed: %s", e)
             sys.exit(1)
 
-def main():
-    """Main entry point"""
-    # Setup argument parser
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(description='Binance Futures Testnet Order Placer')
     
     # Create subparsers for different modes
@@ -229,23 +255,25 @@ def main():
     
     # CLI mode
     cli_parser = subparsers.add_parser('place', help='Place an order directly')
-    cli_parser.add_argument('symbol', help='Trading pair (e.g., BTCUSDT)')
-    cli_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
-    cli_parser.add_argument('order_type', choices=['MARKET', 'LIMIT'], help='Order type')
+    cli_parser.add_argument('symbol', type=str.upper, help='Trading pair (e.g., BTCUSDT)')
+    cli_parser.add_argument('side', type=str.upper, choices=['BUY', 'SELL'], help='Order side')
+    cli_parser.add_argument('order_type', type=str.upper, choices=['MARKET', 'LIMIT'], help='Order type')
     cli_parser.add_argument('quantity', type=float, help='Order quantity')
     cli_parser.add_argument('--price', type=float, help='Price (required for LIMIT orders)')
+    cli_parser.add_argument('--skip-ping', action='store_true',
+                            help='Skip the connection test before placing the order')
     
-    args = parser.parse_args()
+    return parser
+
+# Built once per process and reused by every main() call
+_PARSER = _build_parser()
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
     
     # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('binance_orders.log'),
-            logging.StreamHandler()
-        ]
-    )
+    setup_logging()
     
     # Run the CLI
     cli = OrderCLI()
@@ -255,7 +283,7 @@ def main():
     elif args.mode == 'place':
         cli.run_from_args(args)
     else:
-        parser.print_help()
+        _PARSER.print_help()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file